@@ -1,19 +1,66 @@
 from flask import Flask, render_template, request, jsonify, send_file
-import requests
-from bs4 import BeautifulSoup
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
+import orjson
+import asyncio
+import atexit
+import aiohttp
+from bs4 import BeautifulSoup, SoupStrainer
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # BeautifulSoup is used instead
+    LexborHTMLParser = None
 import re
-from datetime import datetime
+from datetime import date, datetime, time
+from functools import lru_cache, wraps
 from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+from reportlab.lib import colors
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 import io
 import os
+import threading
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache
 from icalendar import Calendar, Event
 from dateutil import parser as date_parser
 from dateutil.relativedelta import relativedelta
 
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider that encodes with orjson; datetimes become ISO 8601 strings"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, default=self.default), mimetype=self.mimetype)
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+
+# Compress JSON and HTML responses (brotli when the client accepts it)
+app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html']
+app.config['COMPRESS_LEVEL'] = 6
+app.config['COMPRESS_MIN_SIZE'] = 500
+Compress(app)
+
+# Search results per normalized city; listings are stable for hours
+SEARCH_CACHE_TTL = 1800
+_SEARCH_CACHE = TTLCache(maxsize=256, ttl=SEARCH_CACHE_TTL)
+_SEARCH_CACHE_LOCK = threading.Lock()
+
+# Category index for each cached search result, keyed by result id
+_EVENTS_BY_CATEGORY = TTLCache(maxsize=256, ttl=SEARCH_CACHE_TTL)
+
+# PDF reports render on a small pool so at most four ReportLab builds run at once
+_PDF_POOL = ThreadPoolExecutor(max_workers=4)
 
 # Event categories for classification
 EVENT_CATEGORIES = {
@@ -27,48 +74,162 @@ EVENT_CATEGORIES = {
     'other': []
 }
 
+# Browser-like headers sent with every scraper request
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# Scrapers share one event loop and ClientSession so keep-alive connections
+# (and their TLS sessions) are reused across searches
+_SCRAPER_LOOP = None
+_SCRAPER_SESSION = None
+_SCRAPER_LOCK = threading.Lock()
+
+# Per-source results by city, so each source expires independently of the
+# /search cache; only touched from the scraper loop, so no locking is needed
+_EB_CACHE = TTLCache(maxsize=128, ttl=900)
+_MEETUP_CACHE = TTLCache(maxsize=128, ttl=900)
+
+# Event cards sit near the top of a listing, so page bodies are truncated
+MAX_PAGE_BYTES = 512_000
+
+# Only build the parts of a page that can hold event data
+# (strainers only apply to the BeautifulSoup fallback)
+PAGE_STRAINER = SoupStrainer(['article', 'div', 'h1', 'h2', 'h3', 'a', 'time', 'span', 'p'])
+
+def _is_eventbrite_card(name, attrs):
+    """SoupStrainer predicate matching Eventbrite event-card elements"""
+    classes = attrs.get('class') or ''
+    if not isinstance(classes, str):
+        classes = ' '.join(classes)
+    class_names = classes.split()
+    return (
+        attrs.get('data-testid') == 'event-card'
+        or 'data-event-id' in attrs
+        or 'event-card' in class_names
+        or 'search-event-card' in class_names
+    )
+
+# Eventbrite pages only need the event-card subtrees
+EB_STRAINER = SoupStrainer(_is_eventbrite_card)
+
+# All Eventbrite card patterns as a single selector
+EB_CARD_CSS = (
+    'article[data-testid="event-card"], div[data-testid="event-card"], '
+    '.search-event-card, .event-card, [data-event-id]'
+)
+
+def _class_css(tags, words):
+    """CSS selector for any of `tags` whose class attribute contains any of `words`"""
+    return ', '.join(f'{tag}[class*="{word}"]' for tag in tags for word in words)
+
+# Meetup element selectors, matched on class-name fragments
+_MEETUP_CARD_CSS = _class_css(['div', 'article'], ['event', 'card'])
+_MEETUP_TITLE_CSS = _class_css(['h1', 'h2', 'h3', 'h4', 'a'], ['title', 'name', 'event'])
+_MEETUP_DATE_CSS = _class_css(['time', 'span', 'div'], ['date', 'time'])
+_MEETUP_LOCATION_CSS = _class_css(['span', 'div'], ['location', 'venue', 'address'])
+_MEETUP_DESCRIPTION_CSS = _class_css(['p', 'div'], ['description', 'summary', 'excerpt'])
+
+# Runs of characters ignored when comparing event titles
+_RE_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+# Meetup-specific overrides
+MEETUP_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
+}
+
+# One compiled keyword alternation per category, in priority order
+_CATEGORY_PATTERNS = [
+    (category, re.compile(r'\b(?:' + '|'.join(map(re.escape, keywords)) + ')', re.IGNORECASE))
+    for category, keywords in EVENT_CATEGORIES.items()
+    if keywords
+]
+
 def categorize_event(title, description):
     """Categorize event based on title and description"""
-    text = (title + ' ' + description).lower()
-    for category, keywords in EVENT_CATEGORIES.items():
-        if any(keyword in text for keyword in keywords):
+    text = title + ' ' + description
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(text):
             return category
     return 'other'
 
-def parse_event_datetime(date_string, city):
-    """Enhanced date parsing with better pattern recognition"""
-    if not date_string or date_string == "Date/Time TBA":
-        return None
-    
-    # Common date patterns
-    patterns = [
-        '%A, %B %d, %Y at %I:%M %p',  # Saturday, Aug 31, 2024 at 2:00 PM
-        '%B %d, %Y at %I:%M %p',      # August 31, 2024 at 2:00 PM
-        '%m/%d/%Y at %I:%M %p',      # 08/31/2024 at 2:00 PM
-        '%Y-%m-%d %H:%M:%S',         # 2024-08-31 14:00:00
-        '%A, %b %d at %I:%M %p',     # Saturday, Aug 31 at 2:00 PM
-    ]
+# Common date patterns
+_DATE_PATTERNS = (
+    '%A, %B %d, %Y at %I:%M %p',  # Saturday, Aug 31, 2024 at 2:00 PM
+    '%B %d, %Y at %I:%M %p',      # August 31, 2024 at 2:00 PM
+    '%m/%d/%Y at %I:%M %p',      # 08/31/2024 at 2:00 PM
+    '%Y-%m-%d %H:%M:%S',         # 2024-08-31 14:00:00
+    '%A, %b %d at %I:%M %p',     # Saturday, Aug 31 at 2:00 PM
+)
+
+# Most recent pattern in _DATE_PATTERNS that parsed successfully
+_last_ok_fmt = [None]
+
+@lru_cache(maxsize=4096)
+def _parse_date_string(date_string, today):
+    """Parse a raw date string; missing fields default to `today`"""
+    # Pages usually stick to one format, so try the last one that worked first
+    last_ok = _last_ok_fmt[0]
+    if last_ok:
+        try:
+            return datetime.strptime(date_string, last_ok)
+        except ValueError:
+            pass
     
-    for pattern in patterns:
+    for pattern in _DATE_PATTERNS:
+        if pattern == last_ok:
+            continue
         try:
             parsed_date = datetime.strptime(date_string, pattern)
-            # Handle past dates
-            now = datetime.now()
-            if parsed_date < now:
-                parsed_date = parsed_date.replace(year=now.year + 1)
-            return parsed_date
         except ValueError:
             continue
-    
-    # Fallback to dateutil parser
-    try:
-        parsed_date = date_parser.parse(date_string, fuzzy=True)
-        now = datetime.now()
-        if parsed_date < now:
-            parsed_date = parsed_date.replace(year=now.year + 1)
+        _last_ok_fmt[0] = pattern
         return parsed_date
-    except:
+    
+    # Fallback to dateutil parser; fuzzy mode is slow, so only use it when a strict parse fails
+    default = datetime.combine(today, time())
+    for fuzzy in (False, True):
+        try:
+            return date_parser.parse(date_string, fuzzy=fuzzy, default=default)
+        except (ValueError, OverflowError):
+            continue
+    return None
+
+def parse_event_datetime(date_string):
+    """Enhanced date parsing with better pattern recognition"""
+    if not date_string or date_string == "Date/Time TBA":
         return None
+    
+    # Scraped pages repeat the same strings, so the parse itself is cached
+    parsed_date = _parse_date_string(date_string, date.today())
+    if parsed_date is None:
+        return None
+    
+    # Handle past dates
+    now = datetime.now()
+    if parsed_date < now:
+        try:
+            parsed_date = parsed_date.replace(year=now.year + 1)
+        except ValueError:
+            return None
+    return parsed_date
+
+def add_derived_fields(event):
+    """Precompute the lowercase text and Unix timestamp (`ts`) that /filter-events compares against"""
+    event['_title_lc'] = event['title'].lower()
+    event['_desc_lc'] = event['description'].lower()
+    parsed_datetime = event['parsed_datetime']
+    event['ts'] = int(parsed_datetime.timestamp()) if parsed_datetime else None
+    return event
+
+def public_event(event):
+    """Copy of an event without the server-side `_` fields, for JSON responses"""
+    return {key: value for key, value in event.items() if not key.startswith('_')}
 
 def parse_event_location(location_string, city):
     """Enhanced location parsing with better validation"""
@@ -90,331 +251,455 @@ def parse_event_location(location_string, city):
     
     return location
 
-def scrape_eventbrite_events(city):
-    """Scrape events from Eventbrite with improved selectors"""
+def _parse_html(html, strainer):
+    """Parse a page with selectolax, or BeautifulSoup if it isn't installed"""
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(html)
+    return BeautifulSoup(html, 'lxml', parse_only=strainer)
+
+def _select(node, selector):
+    """All elements under `node` matching a CSS selector, in document order"""
+    if LexborHTMLParser is None:
+        return node.select(selector)
+    # lexbor reports an element once for every selector in a list it matches,
+    # and can include `node` itself; BeautifulSoup only searches descendants
+    nodes = []
+    for match in node.css(selector):
+        if match != node and (not nodes or match != nodes[-1]):
+            nodes.append(match)
+    return nodes
+
+def _node_id(node):
+    """Identity of an element that is stable across wrapper objects"""
+    if LexborHTMLParser is None:
+        return id(node)
+    return node.mem_id
+
+def _outermost(nodes):
+    """Drop elements nested inside an earlier element of `nodes` (in document order)"""
+    kept_ids = set()
+    outermost = []
+    for node in nodes:
+        parent = node.parent
+        while parent is not None and _node_id(parent) not in kept_ids:
+            parent = parent.parent
+        if parent is None:
+            kept_ids.add(_node_id(node))
+            outermost.append(node)
+    return outermost
+
+def _select_one(node, selector):
+    """First element under `node` matching a CSS selector, or None"""
+    if LexborHTMLParser is None:
+        return node.select_one(selector)
+    for match in node.css(selector):
+        if match != node:
+            return match
+    return None
+
+def _text(node):
+    """Stripped text content of an element"""
+    if LexborHTMLParser is None:
+        return node.get_text(strip=True)
+    return node.text(strip=True)
+
+def _tag(node):
+    """Tag name of an element"""
+    if LexborHTMLParser is None:
+        return node.name
+    return node.tag
+
+def _attr(node, name):
+    """Attribute value of an element, or None"""
+    if LexborHTMLParser is None:
+        return node.get(name)
+    return node.attributes.get(name)
+
+def _scraper_loop():
+    """Background event loop for scraper I/O, started on first use"""
+    global _SCRAPER_LOOP
+    with _SCRAPER_LOCK:
+        if _SCRAPER_LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='scraper-loop', daemon=True).start()
+            _SCRAPER_LOOP = loop
+    return _SCRAPER_LOOP
+
+def run_scraper(coro):
+    """Run a scraper coroutine on the shared loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, _scraper_loop()).result()
+
+def _get_scraper_session():
+    """Shared ClientSession; only called from coroutines on the scraper loop"""
+    global _SCRAPER_SESSION
+    if _SCRAPER_SESSION is None:
+        _SCRAPER_SESSION = aiohttp.ClientSession(
+            headers=HEADERS,
+            timeout=aiohttp.ClientTimeout(total=15),
+            connector=aiohttp.TCPConnector(limit=16, limit_per_host=8, keepalive_timeout=60)
+        )
+    return _SCRAPER_SESSION
+
+@atexit.register
+def _close_scraper_session():
+    """Close pooled scraper connections at interpreter exit"""
+    if _SCRAPER_SESSION is not None:
+        asyncio.run_coroutine_threadsafe(_SCRAPER_SESSION.close(), _SCRAPER_LOOP).result(timeout=5)
+
+def _cache_by_city(cache):
+    """Memoize a scraper coroutine's non-empty results by normalized city"""
+    def decorator(scrape):
+        @wraps(scrape)
+        async def wrapper(session, city):
+            key = city.strip().lower()
+            if key in cache:
+                return cache[key]
+            events = await scrape(session, city)
+            # Empty results are usually a failed fetch, so retry them next time
+            if events:
+                cache[key] = events
+            return events
+        return wrapper
+    return decorator
+
+def eventbrite_urls(city):
+    """Eventbrite listing URLs to try for a city, in order of preference"""
+    return [
+        f"https://www.eventbrite.com/d/{city.lower().replace(' ', '-')}/events/",
+        f"https://www.eventbrite.com/d/{city.lower()}/events/",
+        f"https://www.eventbrite.com/e/search?q={city.replace(' ', '%20')}"
+    ]
+
+def meetup_url(city):
+    """Meetup search URL for a city"""
+    return f"https://www.meetup.com/find/?keywords=&location={city.replace(' ', '%20')}"
+
+async def fetch(session, url, headers=None):
+    """Fetch up to MAX_PAGE_BYTES of a page body, raising on HTTP errors"""
+    async with session.get(url, headers=headers) as response:
+        response.raise_for_status()
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            body += chunk
+            if len(body) >= MAX_PAGE_BYTES:
+                break
+        return bytes(body[:MAX_PAGE_BYTES])
+
+def parse_eventbrite(html, city):
+    """Extract events from an Eventbrite listing page"""
     events = []
+    root = _parse_html(html, EB_STRAINER)
     
-    try:
-        # Multiple Eventbrite URL patterns to try
-        urls = [
-            f"https://www.eventbrite.com/d/{city.lower().replace(' ', '-')}/events/",
-            f"https://www.eventbrite.com/d/{city.lower()}/events/",
-            f"https://www.eventbrite.com/e/search?q={city.replace(' ', '%20')}"
-        ]
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
-        
-        for url in urls:
+    # A card pattern can match inside another card; keep only the outer one
+    event_cards = _outermost(_select(root, EB_CARD_CSS))
+    
+    if event_cards:
+        for card in event_cards[:8]:  # Limit to 8 events
             try:
-                response = requests.get(url, headers=headers, timeout=15)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Multiple selector patterns for Eventbrite
-                selectors = [
-                    'article[data-testid="event-card"]',
-                    'div[data-testid="event-card"]',
-                    '.search-event-card',
-                    '.event-card',
-                    'article.event-card',
-                    'div.event-card',
-                    '[data-event-id]'
+                # Extract title and URL with multiple patterns
+                title = None
+                event_url = None
+                title_selectors = [
+                    'h3 a',
+                    'h2 a', 
+                    'h1 a',
+                    '.event-title a',
+                    '[data-testid="event-title"]',
+                    'a[data-testid="event-title-link"]'
                 ]
                 
-                event_cards = []
-                for selector in selectors:
-                    cards = soup.select(selector)
-                    if cards:
-                        event_cards = cards
+                for sel in title_selectors:
+                    title_elem = _select_one(card, sel)
+                    if title_elem:
+                        title = _text(title_elem)
+                        if _tag(title_elem) == 'a' and _attr(title_elem, 'href'):
+                            event_url = _attr(title_elem, 'href')
+                            if event_url.startswith('/'):
+                                event_url = 'https://www.eventbrite.com' + event_url
                         break
                 
-                if event_cards:
-                    for card in event_cards[:8]:  # Limit to 8 events
-                        try:
-                            # Extract title and URL with multiple patterns
-                            title = None
-                            event_url = None
-                            title_selectors = [
-                                'h3 a',
-                                'h2 a', 
-                                'h1 a',
-                                '.event-title a',
-                                '[data-testid="event-title"]',
-                                'a[data-testid="event-title-link"]'
-                            ]
-                            
-                            for sel in title_selectors:
-                                title_elem = card.select_one(sel)
-                                if title_elem:
-                                    title = title_elem.get_text(strip=True)
-                                    if title_elem.name == 'a' and title_elem.get('href'):
-                                        event_url = title_elem.get('href')
-                                        if event_url.startswith('/'):
-                                            event_url = 'https://www.eventbrite.com' + event_url
-                                    break
-                            
-                            if not title:
-                                continue
-                            
-                            # Extract date/time with multiple patterns
-                            date_time = "Date/Time TBA"
-                            date_selectors = [
-                                'time',
-                                '[data-testid="event-datetime"]',
-                                '.event-date',
-                                '.date-time',
-                                'span[data-testid="event-start-date"]'
-                            ]
-                            
-                            for sel in date_selectors:
-                                date_elem = card.select_one(sel)
-                                if date_elem:
-                                    date_time = date_elem.get_text(strip=True)
-                                    if date_time and date_time != "Date/Time TBA":
-                                        break
-                            
-                            # Extract location
-                            location = f"Downtown {city}"
-                            location_selectors = [
-                                '[data-testid="event-location"]',
-                                '.event-location',
-                                '.venue-name',
-                                'span[data-testid="event-venue"]'
-                            ]
-                            
-                            for sel in location_selectors:
-                                loc_elem = card.select_one(sel)
-                                if loc_elem:
-                                    loc_text = loc_elem.get_text(strip=True)
-                                    if loc_text:
-                                        location = parse_event_location(loc_text, city)
-                                        break
-                            
-                            # Extract description
-                            description = "No description available"
-                            desc_selectors = [
-                                '.event-description',
-                                '.summary',
-                                'p',
-                                '[data-testid="event-summary"]'
-                            ]
-                            
-                            for sel in desc_selectors:
-                                desc_elem = card.select_one(sel)
-                                if desc_elem:
-                                    desc_text = desc_elem.get_text(strip=True)
-                                    if desc_text and len(desc_text) > 20:
-                                        description = desc_text[:200] + "..." if len(desc_text) > 200 else desc_text
-                                        break
-                            
-                            # Parse datetime and categorize
-                            parsed_datetime = parse_event_datetime(date_time, city)
-                            category = categorize_event(title, description)
-                            
-                            events.append({
-                                'title': title,
-                                'date_time': date_time,
-                                'parsed_datetime': parsed_datetime,
-                                'location': location,
-                                'description': description,
-                                'category': category,
-                                'event_url': event_url or f"https://www.eventbrite.com/d/{city.lower().replace(' ', '-')}/events/"
-                            })
-                            
-                        except Exception as e:
-                            continue
-                    
-                    if events:
-                        break  # Found events, no need to try other URLs
-                        
-            except Exception as e:
-                continue
-                
-    except Exception as e:
-        print(f"Error scraping Eventbrite: {e}")
-    
-    return events
-
-def scrape_meetup_events(city):
-    """Scrape events from Meetup.com"""
-    events = []
-    
-    try:
-        # Meetup search URL
-        url = f"https://www.meetup.com/find/?keywords=&location={city.replace(' ', '%20')}"
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Look for event cards
-        event_cards = soup.find_all(['div', 'article'], class_=re.compile(r'event|card'))
-        
-        for card in event_cards[:6]:  # Limit to 6 events
-            try:
-                # Extract title and URL
-                title_elem = card.find(['h1', 'h2', 'h3', 'h4', 'a'], class_=re.compile(r'title|name|event'))
-                if not title_elem:
-                    title_elem = card.find('a')
-                
-                if not title_elem:
+                if not title:
                     continue
-                    
-                title = title_elem.get_text(strip=True)
                 
-                # Extract event URL
-                event_url = None
-                if title_elem.name == 'a' and title_elem.get('href'):
-                    event_url = title_elem.get('href')
-                    if event_url.startswith('/'):
-                        event_url = 'https://www.meetup.com' + event_url
-                elif title_elem.find('a'):
-                    link_elem = title_elem.find('a')
-                    if link_elem.get('href'):
-                        event_url = link_elem.get('href')
-                        if event_url.startswith('/'):
-                            event_url = 'https://www.meetup.com' + event_url
+                # Extract date/time with multiple patterns
+                date_time = "Date/Time TBA"
+                date_selectors = [
+                    'time',
+                    '[data-testid="event-datetime"]',
+                    '.event-date',
+                    '.date-time',
+                    'span[data-testid="event-start-date"]'
+                ]
                 
-                # Extract date
-                date_elem = card.find(['time', 'span', 'div'], class_=re.compile(r'date|time'))
-                date_time = date_elem.get_text(strip=True) if date_elem else "Date/Time TBA"
+                for sel in date_selectors:
+                    date_elem = _select_one(card, sel)
+                    if date_elem:
+                        date_time = _text(date_elem)
+                        if date_time and date_time != "Date/Time TBA":
+                            break
                 
                 # Extract location
-                location_elem = card.find(['span', 'div'], class_=re.compile(r'location|venue|address'))
-                location = parse_event_location(
-                    location_elem.get_text(strip=True) if location_elem else city, 
-                    city
-                )
+                location = f"Downtown {city}"
+                location_selectors = [
+                    '[data-testid="event-location"]',
+                    '.event-location',
+                    '.venue-name',
+                    'span[data-testid="event-venue"]'
+                ]
+                
+                for sel in location_selectors:
+                    loc_elem = _select_one(card, sel)
+                    if loc_elem:
+                        loc_text = _text(loc_elem)
+                        if loc_text:
+                            location = parse_event_location(loc_text, city)
+                            break
                 
                 # Extract description
-                desc_elem = card.find(['p', 'div'], class_=re.compile(r'description|summary|excerpt'))
-                description = "Meetup event - check Meetup.com for full details"
-                if desc_elem:
-                    desc_text = desc_elem.get_text(strip=True)
-                    if len(desc_text) > 20:
-                        description = desc_text[:200] + "..." if len(desc_text) > 200 else desc_text
+                description = "No description available"
+                desc_selectors = [
+                    '.event-description',
+                    '.summary',
+                    'p',
+                    '[data-testid="event-summary"]'
+                ]
                 
-                parsed_datetime = parse_event_datetime(date_time, city)
+                for sel in desc_selectors:
+                    desc_elem = _select_one(card, sel)
+                    if desc_elem:
+                        desc_text = _text(desc_elem)
+                        if desc_text and len(desc_text) > 20:
+                            description = desc_text[:200] + "..." if len(desc_text) > 200 else desc_text
+                            break
+                
+                # Parse datetime and categorize
+                parsed_datetime = parse_event_datetime(date_time)
                 category = categorize_event(title, description)
                 
-                events.append({
+                events.append(add_derived_fields({
                     'title': title,
                     'date_time': date_time,
                     'parsed_datetime': parsed_datetime,
                     'location': location,
                     'description': description,
                     'category': category,
-                    'event_url': event_url or f"https://www.meetup.com/find/?keywords=&location={city.replace(' ', '%20')}"
-                })
+                    'event_url': event_url or f"https://www.eventbrite.com/d/{city.lower().replace(' ', '-')}/events/"
+                }))
                 
             except Exception as e:
                 continue
+    
+    return events
+
+def parse_meetup(html, city):
+    """Extract events from a Meetup search page"""
+    events = []
+    root = _parse_html(html, PAGE_STRAINER)
+    
+    # Look for event cards
+    event_cards = _select(root, _MEETUP_CARD_CSS)
+    
+    for card in event_cards[:6]:  # Limit to 6 events
+        try:
+            # Extract title and URL
+            title_elem = _select_one(card, _MEETUP_TITLE_CSS)
+            if not title_elem:
+                title_elem = _select_one(card, 'a')
+            
+            if not title_elem:
+                continue
+                
+            title = _text(title_elem)
+            
+            # Extract event URL
+            event_url = None
+            if _tag(title_elem) == 'a' and _attr(title_elem, 'href'):
+                event_url = _attr(title_elem, 'href')
+                if event_url.startswith('/'):
+                    event_url = 'https://www.meetup.com' + event_url
+            elif _select_one(title_elem, 'a'):
+                link_elem = _select_one(title_elem, 'a')
+                if _attr(link_elem, 'href'):
+                    event_url = _attr(link_elem, 'href')
+                    if event_url.startswith('/'):
+                        event_url = 'https://www.meetup.com' + event_url
+            
+            # Extract date
+            date_elem = _select_one(card, _MEETUP_DATE_CSS)
+            date_time = _text(date_elem) if date_elem else "Date/Time TBA"
+            
+            # Extract location
+            location_elem = _select_one(card, _MEETUP_LOCATION_CSS)
+            location = parse_event_location(
+                _text(location_elem) if location_elem else city, 
+                city
+            )
+            
+            # Extract description
+            desc_elem = _select_one(card, _MEETUP_DESCRIPTION_CSS)
+            description = "Meetup event - check Meetup.com for full details"
+            if desc_elem:
+                desc_text = _text(desc_elem)
+                if len(desc_text) > 20:
+                    description = desc_text[:200] + "..." if len(desc_text) > 200 else desc_text
+            
+            parsed_datetime = parse_event_datetime(date_time)
+            category = categorize_event(title, description)
+            
+            events.append(add_derived_fields({
+                'title': title,
+                'date_time': date_time,
+                'parsed_datetime': parsed_datetime,
+                'location': location,
+                'description': description,
+                'category': category,
+                'event_url': event_url or f"https://www.meetup.com/find/?keywords=&location={city.replace(' ', '%20')}"
+            }))
+            
+        except Exception as e:
+            continue
+    
+    return events
+
+@_cache_by_city(_EB_CACHE)
+async def scrape_eventbrite_events(session, city):
+    """Scrape events from Eventbrite, fetching all candidate URLs concurrently"""
+    events = []
+    
+    try:
+        pages = await asyncio.gather(
+            *[fetch(session, url) for url in eventbrite_urls(city)],
+            return_exceptions=True
+        )
+        
+        # Keep the URL preference order when picking results
+        for page in pages:
+            if isinstance(page, Exception):
+                continue
+            events = parse_eventbrite(page, city)
+            if events:
+                break  # Found events, no need to look at other URLs
                 
+    except Exception as e:
+        print(f"Error scraping Eventbrite: {e}")
+    
+    return events
+
+@_cache_by_city(_MEETUP_CACHE)
+async def scrape_meetup_events(session, city):
+    """Scrape events from Meetup.com"""
+    events = []
+    
+    try:
+        page = await fetch(session, meetup_url(city), headers=MEETUP_HEADERS)
+        events = parse_meetup(page, city)
     except Exception as e:
         print(f"Error scraping Meetup: {e}")
     
     return events
 
-def get_events_from_multiple_sources(city):
-    """Get events from multiple sources with fallback"""
+def _title_fingerprint(title, city):
+    """Hash of a title with case, punctuation and any trailing city name removed"""
+    normalized = _RE_NON_ALNUM.sub(' ', title.lower()).strip()
+    city_suffix = ' ' + _RE_NON_ALNUM.sub(' ', city.lower()).strip()
+    if normalized.endswith(city_suffix):
+        normalized = normalized[:-len(city_suffix)]
+    return hash(normalized)
+
+def get_demo_events(city):
+    """Enhanced demo events with proper dates, used when no source returns events"""
+    # Use current date + future dates for demo events
+    from datetime import timedelta
+    base_date = datetime.now() + timedelta(days=1)
+    
+    demo_events = [
+        {
+            'title': f'Community Art Festival - {city}',
+            'date_time': f'{(base_date + timedelta(days=1)).strftime("%A, %B %d, %Y at 2:00 PM")}',
+            'parsed_datetime': base_date + timedelta(days=1, hours=14),
+            'location': f'Downtown {city}',
+            'description': 'Join us for a vibrant community art festival featuring local artists, live music, and food vendors. Experience the best of local creativity with interactive exhibits, workshops, and performances.',
+            'category': 'arts',
+            'event_url': f'https://www.eventbrite.com/d/{city.lower().replace(" ", "-")}/events/'
+        },
+        {
+            'title': f'Tech Innovation Meetup - {city}',
+            'date_time': f'{(base_date + timedelta(days=3)).strftime("%A, %B %d, %Y at 6:00 PM")}',
+            'parsed_datetime': base_date + timedelta(days=3, hours=18),
+            'location': f'{city} Convention Center',
+            'description': 'Network with local tech professionals and learn about the latest trends in artificial intelligence, blockchain, and software development. Featuring keynote speakers and networking opportunities.',
+            'category': 'technology',
+            'event_url': f'https://www.meetup.com/find/?keywords=tech&location={city.replace(" ", "%20")}'
+        },
+        {
+            'title': f'Weekend Farmers Market - {city}',
+            'date_time': f'{(base_date + timedelta(days=2)).strftime("%A, %B %d, %Y at 8:00 AM")}',
+            'parsed_datetime': base_date + timedelta(days=2, hours=8),
+            'location': f'{city} City Square',
+            'description': 'Fresh produce, local crafts, and delicious food from local vendors every weekend. Support local farmers and artisans while enjoying live music and family-friendly activities.',
+            'category': 'food',
+            'event_url': f'https://www.eventbrite.com/d/{city.lower().replace(" ", "-")}/food--and--drink--events/'
+        },
+        {
+            'title': f'Live Jazz Night - {city}',
+            'date_time': f'{(base_date + timedelta(days=4)).strftime("%A, %B %d, %Y at 8:00 PM")}',
+            'parsed_datetime': base_date + timedelta(days=4, hours=20),
+            'location': f'Blue Note Cafe, {city}',
+            'description': 'An evening of smooth jazz featuring local musicians and guest performers. Enjoy craft cocktails and appetizers while listening to the best jazz music in the city.',
+            'category': 'music',
+            'event_url': f'https://www.eventbrite.com/d/{city.lower().replace(" ", "-")}/music--events/'
+        },
+        {
+            'title': f'Business Networking Breakfast - {city}',
+            'date_time': f'{(base_date + timedelta(days=5)).strftime("%A, %B %d, %Y at 7:30 AM")}',
+            'parsed_datetime': base_date + timedelta(days=5, hours=7, minutes=30),
+            'location': f'{city} Business Center',
+            'description': 'Connect with local entrepreneurs, business owners, and professionals over breakfast. Exchange ideas, build partnerships, and grow your professional network.',
+            'category': 'networking',
+            'event_url': f'https://www.meetup.com/find/?keywords=networking&location={city.replace(" ", "%20")}'
+        }
+    ]
+    for event in demo_events:
+        add_derived_fields(event)
+    return demo_events
+
+async def get_events_from_multiple_sources(city):
+    """Get events from multiple sources with fallback; also reports whether demo events were used"""
     all_events = []
     
-    # Try Eventbrite first
-    print(f"Searching Eventbrite for events in {city}...")
-    eventbrite_events = scrape_eventbrite_events(city)
+    # Query every source concurrently so the wait is bounded by the slowest request
+    print(f"Searching Eventbrite and Meetup for events in {city}...")
+    session = _get_scraper_session()
+    eventbrite_events, meetup_events = await asyncio.gather(
+        scrape_eventbrite_events(session, city),
+        scrape_meetup_events(session, city)
+    )
+    
     if eventbrite_events:
         all_events.extend(eventbrite_events)
         print(f"Found {len(eventbrite_events)} events from Eventbrite")
     
-    # Try Meetup if we need more events
-    if len(all_events) < 5:
-        print(f"Searching Meetup for events in {city}...")
-        meetup_events = scrape_meetup_events(city)
-        if meetup_events:
-            all_events.extend(meetup_events)
-            print(f"Found {len(meetup_events)} events from Meetup")
+    # Use Meetup if we need more events
+    if len(all_events) < 5 and meetup_events:
+        all_events.extend(meetup_events)
+        print(f"Found {len(meetup_events)} events from Meetup")
     
     # Remove duplicates based on title similarity
     unique_events = []
     seen_titles = set()
     
     for event in all_events:
-        title_key = event['title'].lower().strip()
+        title_key = _title_fingerprint(event['title'], city)
         if title_key not in seen_titles:
             seen_titles.add(title_key)
             unique_events.append(event)
     
-    # If still no events, return enhanced demo events with proper dates
+    # If still no events, fall back to demo events
     if not unique_events:
         print(f"No events found from web sources, using demo events for {city}")
-        # Use current date + future dates for demo events
-        from datetime import timedelta
-        base_date = datetime.now() + timedelta(days=1)
-        
-        unique_events = [
-            {
-                'title': f'Community Art Festival - {city}',
-                'date_time': f'{(base_date + timedelta(days=1)).strftime("%A, %B %d, %Y at 2:00 PM")}',
-                'parsed_datetime': base_date + timedelta(days=1, hours=14),
-                'location': f'Downtown {city}',
-                'description': 'Join us for a vibrant community art festival featuring local artists, live music, and food vendors. Experience the best of local creativity with interactive exhibits, workshops, and performances.',
-                'category': 'arts',
-                'event_url': f'https://www.eventbrite.com/d/{city.lower().replace(" ", "-")}/events/'
-            },
-            {
-                'title': f'Tech Innovation Meetup - {city}',
-                'date_time': f'{(base_date + timedelta(days=3)).strftime("%A, %B %d, %Y at 6:00 PM")}',
-                'parsed_datetime': base_date + timedelta(days=3, hours=18),
-                'location': f'{city} Convention Center',
-                'description': 'Network with local tech professionals and learn about the latest trends in artificial intelligence, blockchain, and software development. Featuring keynote speakers and networking opportunities.',
-                'category': 'technology',
-                'event_url': f'https://www.meetup.com/find/?keywords=tech&location={city.replace(" ", "%20")}'
-            },
-            {
-                'title': f'Weekend Farmers Market - {city}',
-                'date_time': f'{(base_date + timedelta(days=2)).strftime("%A, %B %d, %Y at 8:00 AM")}',
-                'parsed_datetime': base_date + timedelta(days=2, hours=8),
-                'location': f'{city} City Square',
-                'description': 'Fresh produce, local crafts, and delicious food from local vendors every weekend. Support local farmers and artisans while enjoying live music and family-friendly activities.',
-                'category': 'food',
-                'event_url': f'https://www.eventbrite.com/d/{city.lower().replace(" ", "-")}/food--and--drink--events/'
-            },
-            {
-                'title': f'Live Jazz Night - {city}',
-                'date_time': f'{(base_date + timedelta(days=4)).strftime("%A, %B %d, %Y at 8:00 PM")}',
-                'parsed_datetime': base_date + timedelta(days=4, hours=20),
-                'location': f'Blue Note Cafe, {city}',
-                'description': 'An evening of smooth jazz featuring local musicians and guest performers. Enjoy craft cocktails and appetizers while listening to the best jazz music in the city.',
-                'category': 'music',
-                'event_url': f'https://www.eventbrite.com/d/{city.lower().replace(" ", "-")}/music--events/'
-            },
-            {
-                'title': f'Business Networking Breakfast - {city}',
-                'date_time': f'{(base_date + timedelta(days=5)).strftime("%A, %B %d, %Y at 7:30 AM")}',
-                'parsed_datetime': base_date + timedelta(days=5, hours=7, minutes=30),
-                'location': f'{city} Business Center',
-                'description': 'Connect with local entrepreneurs, business owners, and professionals over breakfast. Exchange ideas, build partnerships, and grow your professional network.',
-                'category': 'networking',
-                'event_url': f'https://www.meetup.com/find/?keywords=networking&location={city.replace(" ", "%20")}'
-            }
-        ]
+        return get_demo_events(city)[:10], True
     
-    return unique_events[:10]  # Limit to 10 events total
+    return unique_events[:10], False  # Limit to 10 events total
 
 def create_weekend_digest(events):
     """Create a weekend plan digest from top 3 events"""
@@ -465,12 +750,29 @@ def create_pdf_report(events, city, digest):
     story.append(Paragraph("All Events", styles['Heading2']))
     story.append(Spacer(1, 12))
     
-    for event in events:
-        story.append(Paragraph(f"<b>{event['title']}</b>", styles['Heading3']))
-        story.append(Paragraph(f"<b>Date & Time:</b> {event['date_time']}", styles['Normal']))
-        story.append(Paragraph(f"<b>Location:</b> {event['location']}", styles['Normal']))
-        story.append(Paragraph(f"<b>Description:</b> {event['description']}", styles['Normal']))
-        story.append(Spacer(1, 15))
+    # One table row per event: title on the left, details on the right
+    h3, normal = styles['Heading3'], styles['Normal']
+    data = [
+        [
+            Paragraph(f"<b>{event['title']}</b>", h3),
+            Paragraph(
+                f"<b>Date & Time:</b> {event['date_time']}<br/>"
+                f"<b>Location:</b> {event['location']}<br/>"
+                f"<b>Description:</b> {event['description']}",
+                normal
+            )
+        ]
+        for event in events
+    ]
+    if data:
+        events_table = Table(data, colWidths=[2 * inch, 4.5 * inch])
+        events_table.setStyle(TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('LINEBELOW', (0, 0), (-1, -1), 0.5, colors.lightgrey),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ]))
+        story.append(events_table)
     
     doc.build(story)
     buffer.seek(0)
@@ -490,18 +792,39 @@ def search_events():
     if not city:
         return jsonify({'error': 'Please enter a city name'})
     
+    # Serve repeat searches for a city from the cache
+    key = city.lower()
+    with _SEARCH_CACHE_LOCK:
+        cached = _SEARCH_CACHE.get(key)
+    if cached is not None:
+        return jsonify(dict(cached, city=city))
+    
     # Scrape events from multiple sources
-    events = get_events_from_multiple_sources(city)
+    events, is_demo = run_scraper(get_events_from_multiple_sources(city))
     
     # Create digest
     digest = create_weekend_digest(events)
     
-    return jsonify({
+    # Index the events by category so /filter-events can skip category scans
+    result_id = uuid.uuid4().hex
+    events_by_category = defaultdict(list)
+    for event in events:
+        events_by_category[event['category']].append(event)
+    
+    result = {
         'city': city,
-        'events': events,
+        'events': [public_event(event) for event in events],
         'digest': digest,
-        'total_events': len(events)
-    })
+        'total_events': len(events),
+        'result_id': result_id
+    }
+    # Demo events stand in for a failed scrape, so don't keep serving them
+    if not is_demo:
+        with _SEARCH_CACHE_LOCK:
+            _SEARCH_CACHE[key] = result
+            _EVENTS_BY_CATEGORY[result_id] = events_by_category
+    
+    return jsonify(result)
 
 @app.route('/download-pdf', methods=['POST'])
 def download_pdf():
@@ -511,10 +834,9 @@ def download_pdf():
     events = data.get('events', [])
     digest = data.get('digest', '')
     
-    # Create PDF
-    pdf_buffer = create_pdf_report(events, city, digest)
+    # Render on the shared pool, which caps concurrent ReportLab builds
+    pdf_buffer = _PDF_POOL.submit(create_pdf_report, events, city, digest).result()
     
-    # Save to temporary file
     filename = f"events_{city.replace(' ', '_').lower()}_{datetime.now().strftime('%Y%m%d')}.pdf"
     
     return send_file(
@@ -524,6 +846,14 @@ def download_pdf():
         mimetype='application/pdf'
     )
 
+def _filter_bound(filters, ts_key, date_key):
+    """Date-range bound as epoch seconds, from an int `ts_key` or a YYYY-MM-DD `date_key`"""
+    if filters.get(ts_key) is not None:
+        return int(filters[ts_key])
+    if filters.get(date_key):
+        return int(datetime.fromisoformat(filters[date_key]).timestamp())
+    return None
+
 @app.route('/filter-events', methods=['POST'])
 def filter_events():
     """Filter events based on various criteria"""
@@ -531,27 +861,46 @@ def filter_events():
     events = data.get('events', [])
     filters = data.get('filters', {})
     
-    filtered_events = events
-    
-    # Category filter
-    if filters.get('category') and filters['category'] != 'all':
-        filtered_events = [e for e in filtered_events if e.get('category') == filters['category']]
-    
-    # Date range filter
-    if filters.get('date_from'):
-        from_date = datetime.strptime(filters['date_from'], '%Y-%m-%d')
-        filtered_events = [e for e in filtered_events if e.get('parsed_datetime') and e['parsed_datetime'] >= from_date]
-    
-    if filters.get('date_to'):
-        to_date = datetime.strptime(filters['date_to'], '%Y-%m-%d')
-        filtered_events = [e for e in filtered_events if e.get('parsed_datetime') and e['parsed_datetime'] <= to_date]
-    
-    # Search filter
-    if filters.get('search'):
-        search_term = filters['search'].lower()
-        filtered_events = [e for e in filtered_events if search_term in e['title'].lower() or search_term in e['description'].lower()]
+    category = filters.get('category')
+    if category == 'all':
+        category = None
+    try:
+        ts_from = _filter_bound(filters, 'ts_from', 'date_from')
+        ts_to = _filter_bound(filters, 'ts_to', 'date_to')
+    except (TypeError, ValueError):
+        return jsonify({'error': 'Invalid date filter'}), 400
+    search_term = (filters.get('search') or '').lower()
+    
+    # Start from the category index built by /search while it is still cached
+    if category and data.get('result_id'):
+        with _SEARCH_CACHE_LOCK:
+            events_by_category = _EVENTS_BY_CATEGORY.get(data['result_id'])
+        if events_by_category is not None:
+            events = events_by_category.get(category, [])
+            category = None
+    
+    # Apply every filter in a single pass
+    filtered_events = []
+    for e in events:
+        if category and e.get('category') != category:
+            continue
+        if ts_from is not None or ts_to is not None:
+            ts = e.get('ts')
+            if ts is None:
+                continue
+            if ts_from is not None and ts < ts_from:
+                continue
+            if ts_to is not None and ts > ts_to:
+                continue
+        if search_term:
+            # Posted events may lack the precomputed fields; fall back to the originals
+            title_lc = e.get('_title_lc') or (e.get('title') or '').lower()
+            desc_lc = e.get('_desc_lc') or (e.get('description') or '').lower()
+            if search_term not in title_lc and search_term not in desc_lc:
+                continue
+        filtered_events.append(e)
     
-    return jsonify({'events': filtered_events, 'total': len(filtered_events)})
+    return jsonify({'events': [public_event(e) for e in filtered_events], 'total': len(filtered_events)})
 
 
 if __name__ == '__main__':
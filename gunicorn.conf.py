@@ -0,0 +1,13 @@
+# Gunicorn settings, picked up automatically by `gunicorn wsgi:app`
+bind = '0.0.0.0:5000'
+
+# Searches spend most of their time waiting on the network, so threads
+# let each worker serve other users while a scrape is in flight.
+# The search caches and the /filter-events category index live in each
+# worker's memory; a request landing on another worker just misses them
+# (re-scraping, or filtering the events the page posts), so they are safe
+# to run per-process. Nothing else keeps request state between calls.
+workers = 2
+worker_class = 'gthread'
+threads = 8
+timeout = 30